@@ -45,7 +45,7 @@ from . import __version__
 from . import plugin
 from . import options
 
-from .util import pushdir, push_python_path
+from .util import pushdir
 
 
 def install_plugin(p):
@@ -74,6 +74,7 @@ __all__ = ['MCMCDraw', 'load_state', 'save_state']
 import os.path
 import re
 import gzip
+import copy
 
 import numpy as np
 from numpy import empty, sum, asarray, inf, argmax, hstack, dstack
@@ -421,6 +422,26 @@ class MCMCDraw(object):
             self._update_draws = self._update_draws[-Nupdate:].copy()
             self._update_CR_weight = self._update_CR_weight[-Nupdate:, :].copy()
 
+    def snapshot(self):
+        """
+        Return a copy of the state for use by monitors and views.
+
+        This is much cheaper than :func:`copy.deepcopy`, which walks every
+        attribute through the pickle machinery.  Only the accumulation
+        arrays that the sampler continues to write are copied; scalars and
+        arrays that are replaced wholesale rather than mutated in place
+        (such as the best point) are shared with the live state.
+        """
+        dup = copy.copy(self)
+        for attr in ('_gen_draws', '_gen_logp', '_gen_acceptance_rate',
+                     '_thin_draws', '_thin_point', '_thin_logp',
+                     '_update_draws', '_update_CR_weight'):
+            setattr(dup, attr, getattr(self, attr).copy())
+        if self._gen_current is not None:
+            dup._gen_current = self._gen_current.copy()
+        dup._outliers = list(self._outliers)
+        return dup
+
     def save(self, filename):
         save_state(self, filename)
 
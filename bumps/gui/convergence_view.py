@@ -13,7 +13,20 @@ class ConvergenceMonitor(monitor.Monitor):
     range.  This will be the input for the convergence plot.
     """
     def __init__(self):
-        self.pop = []
+        # Rows accumulate in a preallocated array grown by doubling, so each
+        # step writes into a reserved slot instead of allocating a tuple and
+        # progress() slices the buffer instead of rebuilding the array.
+        self._pop = None
+        self._n = 0
+    def _append(self, row):
+        if self._pop is None:
+            self._pop = np.empty((64, len(row)), 'd')
+        elif self._n == self._pop.shape[0]:
+            grown = np.empty((2*self._pop.shape[0],) + self._pop.shape[1:], 'd')
+            grown[:self._n] = self._pop
+            self._pop = grown
+        self._pop[self._n] = row
+        self._n += 1
     def config_history(self, history):
         history.requires(population_values=1, value=1)
     def __call__(self, history):
@@ -21,16 +34,17 @@ class ConvergenceMonitor(monitor.Monitor):
         try:
             pop = history.population_values[0]
             n = len(pop)
-            p = np.sort(pop)
             QI,Qmid, = int(0.2*n),int(0.5*n)
-            self.pop.append((best, p[0],p[QI],p[Qmid],p[-1-QI],p[-1]))
+            # Partial sort: only five order statistics are plucked below.
+            p = np.partition(pop, (0, QI, Qmid, n-1-QI, n-1))
+            self._append((best, p[0],p[QI],p[Qmid],p[-1-QI],p[-1]))
         except AttributeError:
-            self.pop.append((best, ))
+            self._append((best, ))
     def progress(self):
-        if not self.pop:
+        if self._n == 0:
             return dict(pop=np.empty((0,1),'d'))
         else:
-            return dict(pop=np.array(self.pop))
+            return dict(pop=self._pop[:self._n])
 
 
 class ConvergenceView(PlotView):
@@ -1,4 +1,5 @@
 
+import pickle
 from copy import deepcopy
 from threading import Thread
 import os
@@ -35,7 +36,7 @@ class GUIProgressMonitor(monitor.TimedUpdate):
             message="progress",
             step=history.step[0],
             value=history.value[0],
-            point=history.point[0]+0) # avoid race
+            point=history.point[0].copy()) # copy to avoid race with the fitter
         wx.PostEvent(self.win, evt)
 
     def show_improvement(self, history):
@@ -44,7 +45,7 @@ class GUIProgressMonitor(monitor.TimedUpdate):
             message="improvement",
             step=history.step[0],
             value=history.value[0],
-            point=history.point[0]+0) # avoid race
+            point=history.point[0].copy()) # copy to avoid race with the fitter
         wx.PostEvent(self.win, evt)
 
 class GUIMonitor(monitor.Monitor):
@@ -191,9 +192,20 @@ class FitThread(Thread):
         # Only use parallel if the problem can be pickled
         mapper = MPMapper if can_pickle(self.problem) else SerialMapper
 
-        # Be safe and send a private copy of the problem to the fitting engine
+        # Be safe and send a private copy of the problem to the fitting
+        # engine.  Use the problem's own clone method when it has one,
+        # otherwise a pickle round trip, which is much faster than deepcopy
+        # for large model trees; deepcopy remains the fallback for problems
+        # that cannot be pickled.
         #print "fitclass",self.fitclass
-        problem = deepcopy(self.problem)
+        if hasattr(self.problem, 'clone'):
+            problem = self.problem.clone()
+        else:
+            try:
+                problem = pickle.loads(pickle.dumps(
+                    self.problem, protocol=pickle.HIGHEST_PROTOCOL))
+            except Exception:
+                problem = deepcopy(self.problem)
         #print "fitclass id",id(self.fitclass),self.fitclass,threading.current_thread()
         driver = FitDriver(
             self.fitclass, problem=problem,
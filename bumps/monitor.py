@@ -19,7 +19,7 @@ bumps.fitters.MonitorRunner class manages history and updates.
 """
 from __future__ import print_function
 
-__all__ = ['Monitor', 'Logger', 'TimedUpdate']
+__all__ = ['Monitor', 'Logger', 'TimedUpdate', 'SampledMonitor']
 
 from numpy import inf
 
@@ -84,6 +84,37 @@ class Logger(Monitor):
         self.table.store(**record)
 
 
+class SampledMonitor(Monitor):
+    """
+    Forward history updates to *monitor* only every *period* calls.
+
+    Monitors run on every fit iteration, so for fast fitters even a cheap
+    monitor adds per-step overhead.  Wrapping it in *SampledMonitor* bounds
+    that cost by skipping all but every *period*-th update.  A *final*
+    call on the wrapper is always forwarded to the wrapped monitor when it
+    provides one, so terminal output is never lost to sampling.
+    """
+    def __init__(self, monitor, period=1):
+        if period < 1:
+            raise ValueError("period must be at least 1")
+        self.monitor = monitor
+        self.period = period
+        self._count = 0
+
+    def config_history(self, history):
+        self.monitor.config_history(history)
+
+    def __call__(self, history):
+        self._count += 1
+        if self._count % self.period == 0:
+            self.monitor(history)
+
+    def final(self):
+        final = getattr(self.monitor, 'final', None)
+        if final is not None:
+            final()
+
+
 class TimedUpdate(Monitor):
     """
     Indicate progress every n seconds.
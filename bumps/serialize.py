@@ -14,7 +14,7 @@ import warnings
 import asyncio
 from collections import defaultdict
 
-from .util import SCHEMA_ATTRIBUTE_NAME, NumpyArray
+from .util import DATACLASS_SLOTS, SCHEMA_ATTRIBUTE_NAME, NumpyArray
 
 DEBUG = False
 
@@ -30,7 +30,7 @@ REFERENCE_TYPE_NAME = "Reference"
 REFERENCE_TYPE = Literal["Reference"]
 TYPE_KEY = "__class__"
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Reference:
     id: str
     type: REFERENCE_TYPE
@@ -132,6 +132,31 @@ def _find_ref_dependencies(obj, dependencies: set):
 
 #### end deserializer helpers
 
+# Per-class cache of (serializable field names, fully qualified name).  The
+# fields() call and the include/exclude filtering depend only on the class
+# (include/exclude come from the class-level schema config), so compute them
+# once per class rather than once per instance serialized.
+_CLASS_FIELDS_CACHE: Dict[type, Tuple[List[str], str]] = {}
+
+def _serializable_fields(cls, include=None, exclude=None):
+    try:
+        return _CLASS_FIELDS_CACHE[cls]
+    except KeyError:
+        pass
+    inc = frozenset(include) if include is not None else None
+    exc = frozenset(exclude) if exclude is not None else None
+    names = []
+    for f in fields(cls):
+        name = f.name
+        if inc is not None:
+            if name in inc:
+                names.append(name)
+        elif not name.startswith('_') and (exc is None or name not in exc):
+            names.append(name)
+    fqn = f"{cls.__module__}.{cls.__qualname__}"
+    _CLASS_FIELDS_CACHE[cls] = (names, fqn)
+    return names, fqn
+
 def serialize(obj, use_refs=True):
     references = {}
 
@@ -139,16 +164,9 @@ def serialize(obj, use_refs=True):
         return {"id": obj_id, TYPE_KEY: REFERENCE_TYPE_NAME}
 
     def dataclass_to_dict(dclass, include=None, exclude=None):
-        all_fields = fields(dclass)
-        if include is not None:
-            all_fields = [f for f in all_fields if f.name in include]
-        elif exclude is not None:
-            all_fields = [f for f in all_fields if not f.name in exclude and not f.name.startswith('_')]
-        else:
-            all_fields = [f for f in all_fields if not f.name.startswith('_')]
-        cls = dclass.__class__
-        fqn = f"{cls.__module__}.{cls.__qualname__}"
-        output = dict([(f.name, obj_to_dict(getattr(dclass, f.name))) for f in all_fields])
+        names, fqn = _serializable_fields(
+            dclass.__class__, include=include, exclude=exclude)
+        output = dict([(name, obj_to_dict(getattr(dclass, name))) for name in names])
         output[TYPE_KEY] = fqn
         return output
 
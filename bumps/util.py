@@ -8,17 +8,10 @@ __all__ = ["kbhit", "profile", "pushdir", "push_seed", "redirect_console"]
 
 import sys
 import os
+import re
 import types
 import inspect
 
-from io import StringIO
-
-import numpy as np
-from numpy import ascontiguousarray as _dense
-# **DEPRECATED** we can import erf directly from scipy.special.erf
-# so there is no longer a need for bumps.util.erf.
-from scipy.special import erf
-
 # this can be substituted with pydantic dataclass for schema-building...
 try:
     from typing import Literal, Protocol, runtime_checkable
@@ -32,6 +25,22 @@ if TYPE_CHECKING:
 
 from dataclasses import dataclass, field, is_dataclass, Field
 
+
+def __getattr__(name):
+    # **DEPRECATED** import erf directly from scipy.special; the re-export
+    # is resolved lazily so that importing bumps.util does not drag in the
+    # scipy shared libraries.
+    if name == "erf":
+        from scipy.special import erf
+        return erf
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+# dataclass(slots=True) drops the per-instance __dict__, saving memory and an
+# indirection on attribute access for internal containers, but it is only
+# available on python 3.10+.  Use as @dataclass(..., **DATACLASS_SLOTS).
+DATACLASS_SLOTS = dict(slots=True) if sys.version_info >= (3, 10) else {}
+
 def field_desc(description: str) -> Any:
     return field(metadata={"description": description})
 
@@ -60,7 +69,7 @@ def schema_config(
 def has_schema_config(cls):
     return is_dataclass(cls) and hasattr(cls, SCHEMA_ATTRIBUTE_NAME)
 
-@dataclass(init=True)
+@dataclass(init=True, **DATACLASS_SLOTS)
 class NumpyArray:
     """
     Wrapper for numpy arrays:
@@ -78,6 +87,8 @@ if USE_PYDANTIC:
     from typing import TypeAlias
     NDArray: TypeAlias = NumpyArray
 
+_ERRFILE_CHISQ = re.compile(r"^\[(overall +)?chisq=([^,\]\s]+)", re.M)
+
 def parse_errfile(errfile):
     """
     Parse dream statistics from a particular fit.
@@ -96,22 +107,41 @@ def parse_errfile(errfile):
         errfile = glob.glob(os.path.join(path, '*.err'))[0]
     """
     from .dream.stats import parse_var
-    pars = []
-    chisq = []
-    overall = None
+    # Slurp the file and scan it with a single compiled regex; per-line
+    # reads and string slicing in python are much slower for large errfiles.
     with open(errfile) as fid:
-        for line in fid:
-            if line.startswith("[overall"):
-                overall = float(line.split()[1][6:-1])
-                continue
+        text = fid.read()
 
-            if line.startswith("[chisq"):
-                chisq.append(float(line.split()[0][7:-1]))
-                continue
+    # Matches "[chisq=x, nllf=y]" and "[overall chisq=x, nllf=y]" lines,
+    # capturing the optional "overall" marker and the chisq value.
+    overall = None
+    chisq = []
+    matched = 0
+    for m in _ERRFILE_CHISQ.finditer(text):
+        matched += 1
+        value = float(m.group(2))
+        if m.group(1):
+            overall = value
+        else:
+            chisq.append(value)
+
+    lines = text.splitlines()
+    chisq_like = [line for line in lines
+                  if line.startswith(("[overall", "[chisq"))]
+    if matched != len(chisq_like):
+        # Format drift: fall back to token slicing of the individual lines
+        # ("chisq=" prefix and trailing "," removed from the value token).
+        overall = None
+        del chisq[:]
+        for line in chisq_like:
+            if line.startswith("[overall"):
+                overall = float(line.split(None, 2)[1][6:-1])
+            else:
+                chisq.append(float(line.partition(" ")[0][7:-1]))
 
-            p = parse_var(line)
-            if p is not None:
-                pars.append(p)
+    pars = [p for p in (parse_var(line) for line in lines
+                        if not line.startswith(("[overall", "[chisq")))
+            if p is not None]
 
     if overall is None:
         overall = chisq[0]
@@ -122,24 +152,33 @@ def parse_errfile(errfile):
 def profile(fn, *args, **kw):
     """
     Profile a function called with the given arguments.
+
+    The profile report is printed to *stream*, which defaults to standard
+    output.  Pass a StringIO-like object as a keyword argument to capture
+    the report as a string instead.
     """
     import cProfile
     import pstats
 
-    result = [None]
-    def call():
-        result[0] = fn(*args, **kw)
-    datafile = 'profile.out'
-    cProfile.runctx('call()', dict(call=call), {}, datafile)
-    stats = pstats.Stats(datafile)
-    # order='calls'
-    order = 'cumulative'
-    # order='pcalls'
-    # order='time'
-    stats.sort_stats(order)
-    stats.print_stats()
-    os.unlink(datafile)
-    return result[0]
+    stream = kw.pop('stream', None)
+    profiler = cProfile.Profile()
+    # Profile in memory rather than round-tripping the data through a file
+    # on disk; this also lets concurrent fits profile without colliding on
+    # a shared filename.
+    profiler.enable()
+    try:
+        result = fn(*args, **kw)
+    finally:
+        profiler.disable()
+        stats = (pstats.Stats(profiler) if stream is None
+                 else pstats.Stats(profiler, stream=stream))
+        # order='calls'
+        order = 'cumulative'
+        # order='pcalls'
+        # order='time'
+        stats.sort_stats(order)
+        stats.print_stats()
+    return result
 
 
 def kbhit():
@@ -184,6 +223,31 @@ def relative_import(filename, module_name="relative_import"):
     return module_name
 
 
+class _ListWriter(object):
+    """
+    Minimal file-like object that captures writes into a list of strings.
+
+    Appending string fragments and joining on demand in *getvalue* is
+    cheaper than StringIO for write-heavy capture such as driver.show()
+    output, which repeatedly grows the buffer.
+    """
+    def __init__(self):
+        self._buf = []
+        self.write = self._buf.append
+
+    def writelines(self, lines):
+        self._buf.extend(lines)
+
+    def getvalue(self):
+        return "".join(self._buf)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        del self._buf[:]
+
+
 class redirect_console(object):
     """
     Console output redirection context
@@ -195,9 +259,9 @@ class redirect_console(object):
     redirected to the same file.  The open file handle is returned on
     enter, and (if it was not an already opened file) it is closed on exit.
 
-    If no file is specified, then output is redirected to a StringIO
+    If no file is specified, then output is redirected to a buffer
     object, which has a getvalue() method which can retrieve the string.
-    The StringIO object is deleted when the context ends, so be sure to
+    The buffer is deleted when the context ends, so be sure to
     retrieve its value within the redirect_console context.
 
     :Example:
@@ -230,12 +294,12 @@ class redirect_console(object):
         self.sys_stderr = []
 
         if stdout is None:
-            self.open_files.append(StringIO())
+            self.open_files.append(_ListWriter())
             self.stdout = self.open_files[-1]
         elif hasattr(stdout, 'write'):
             self.stdout = stdout
         else:
-            self.open_files.append(open(stdout, 'w'))
+            self.open_files.append(self._open(stdout))
             self.stdout = self.open_files[-1]
 
         if stderr is None:
@@ -243,9 +307,18 @@ class redirect_console(object):
         elif hasattr(stderr, 'write'):
             self.stderr = stderr
         else:
-            self.open_files.append(open(stderr, 'w'))
+            self.open_files.append(self._open(stderr))
             self.stderr = self.open_files[-1]
 
+    @staticmethod
+    def _open(filename):
+        # utf-8 with errors='replace' so that stray non-ascii output cannot
+        # raise UnicodeEncodeError and tear down the context mid-capture,
+        # and a large block buffer so captured prints coalesce into few
+        # write() syscalls rather than one per line.
+        return open(filename, 'w', encoding='utf-8', errors='replace',
+                    buffering=1 << 16)
+
     def __del__(self):
         for f in self.open_files:
             f.close()
@@ -262,33 +335,12 @@ class redirect_console(object):
         sys.stderr = self.sys_stderr[-1]
         del self.sys_stdout[-1]
         del self.sys_stderr[-1]
+        # Push buffered output to disk so the file is complete even though
+        # it is not closed until the context object is deleted.
+        for f in self.open_files:
+            f.flush()
         return False
 
-class push_python_path(object):
-    """
-    Change sys.path for the duration of a with statement.
-
-    :Example:
-
-    Show that the original directory is restored::
-
-        >>> import sys, os
-        >>> original_path = list(sys.path)
-        >>> with push_python_path('/tmp'):
-        ...     assert sys.path[-1] == '/tmp'
-        >>> restored_path = list(sys.path)
-        >>> assert original_path == restored_path
-    """
-    def __init__(self, path):
-        self.path = path
-
-    def __enter__(self):
-        sys.path.append(self.path)
-
-    def __exit__(self, *args):
-        del sys.path[-1]
-
-
 class pushdir(object):
     """
     Change directories for the duration of a with statement.
@@ -307,11 +359,13 @@ class pushdir(object):
         >>> assert original_wd == restored_wd
     """
     def __init__(self, path):
-        self.path = os.path.abspath(path)
+        self.path = path
 
     def __enter__(self):
+        # Resolve the path on entry rather than in the constructor so that
+        # building the context manager doesn't touch the filesystem.
         self._cwd = os.getcwd()
-        os.chdir(self.path)
+        os.chdir(os.path.abspath(self.path))
 
     def __exit__(self, *args):
         os.chdir(self._cwd)
@@ -329,6 +383,12 @@ class push_seed(object):
     *seed* : int or array_like, optional
         Seed for RandomState
 
+    *local* : bool
+        If True, return an isolated :class:`numpy.random.Generator` from
+        the with statement instead of seeding the global generator.  The
+        global random number stream is neither saved nor restored, which
+        avoids the state snapshot on every enter/exit.
+
     :Example:
 
     Seed can be used directly to set the seed::
@@ -374,13 +434,28 @@ class push_seed(object):
         [242082    899 211136]
         Exception raised
         899
+
+    With *local=True* the global stream is untouched and the generator
+    is returned from the with statement::
+
+        >>> with push_seed(24, local=True) as rng:
+        ...    print(rng.integers(0, 1000000, 3))
+        [382675 330268 751192]
     """
-    def __init__(self, seed=None):
-        self._state = np.random.get_state()
-        np.random.seed(seed)
+    def __init__(self, seed=None, local=False):
+        import numpy as np
+        if local:
+            self._state = None
+            self._rng = np.random.Generator(np.random.PCG64(seed))
+        else:
+            self._state = np.random.get_state()
+            self._rng = None
+            np.random.seed(seed)
 
     def __enter__(self):
-        return None
+        return self._rng
 
     def __exit__(self, *args):
-        np.random.set_state(self._state)
+        if self._state is not None:
+            import numpy as np
+            np.random.set_state(self._state)
@@ -4,7 +4,9 @@ from types import GeneratorType
 from typing import Any, Callable, Coroutine, Dict, List, Literal, Mapping, Optional, Sequence, Union, Tuple, TypedDict, cast
 from datetime import datetime
 import numbers
+import threading
 import warnings
+from collections import deque
 from threading import Event
 import numpy as np
 import asyncio
@@ -447,7 +449,12 @@ async def _fit_progress_handler(event: Dict):
     elif message == 'progress':
         await emit("fit_progress", to_json_compatible_dict(event))
     elif message == 'uncertainty_update' or message == 'uncertainty_final':
-        state.fitting.uncertainty_state = cast(bumps.dream.state.MCMCDraw, event["uncertainty_state"])
+        # The monitor sends the live MCMC state; take the snapshot here on
+        # the consumer side so the copy cost stays off the fit thread.
+        uncertainty_state = cast(bumps.dream.state.MCMCDraw, event["uncertainty_state"])
+        if uncertainty_state is not None and message == 'uncertainty_update':
+            uncertainty_state = uncertainty_state.snapshot()
+        state.fitting.uncertainty_state = uncertainty_state
         state.shared.updated_uncertainty = now_string()
         state.autosave()
         if message == 'uncertainty_final':
@@ -489,10 +496,42 @@ async def _fit_complete_handler(event):
     if terminate:
         await shutdown()
 
+# Progress events from the fit thread are staged in a thread-safe deque and
+# drained by a single coroutine on the event loop.  The loop is only woken
+# when the queue transitions from empty to non-empty, so a burst of events
+# costs one cross-thread wakeup instead of one per event.
+_fit_progress_events: deque = deque()
+_fit_progress_drain_lock = threading.Lock()
+_fit_progress_drain_scheduled = False
+
+async def _drain_fit_progress():
+    global _fit_progress_drain_scheduled
+    while True:
+        with _fit_progress_drain_lock:
+            if not _fit_progress_events:
+                _fit_progress_drain_scheduled = False
+                return
+            event = _fit_progress_events.popleft()
+        try:
+            await _fit_progress_handler(event)
+        except Exception:
+            # Keep draining on handler failure; dying here would leave the
+            # scheduled flag set and stall all further progress updates.
+            logger.exception("error handling fit progress event %r"
+                             % event.get("message"))
+
 def fit_progress_handler(event: Dict):
+    global _fit_progress_drain_scheduled
     loop = getattr(state, 'calling_loop', None)
-    if loop is not None:
-        asyncio.run_coroutine_threadsafe(_fit_progress_handler(event), loop)
+    if loop is None:
+        return
+    with _fit_progress_drain_lock:
+        _fit_progress_events.append(event)
+        if _fit_progress_drain_scheduled:
+            # a drain pass is already pending; it will pick this event up
+            return
+        _fit_progress_drain_scheduled = True
+    asyncio.run_coroutine_threadsafe(_drain_fit_progress(), loop)
 
 def fit_complete_handler(event: Dict):
     loop = getattr(state, 'calling_loop', None)
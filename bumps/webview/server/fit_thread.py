@@ -1,4 +1,6 @@
 
+import pickle
+import time
 from copy import deepcopy
 from threading import Thread
 from threading import Event
@@ -22,35 +24,77 @@ IMPROVEMENT_DELAY = 5
 EVT_FIT_PROGRESS = Signal()
 EVT_FIT_COMPLETE = Signal()
 
+# Minimum wall-clock seconds between coalesced progress events.  Fast fits
+# can emit updates far quicker than the event loop consumes them; dropping
+# superseded events keeps the cross-thread traffic bounded.
+SEND_MIN_INTERVAL = 0.05
+
 # NOTE: GUI monitors are running in a separate thread.  They should not
 # touch the problem internals.
 
 
+class _EventCoalescer(object):
+    """
+    One-slot buffer for idempotent fit progress events.
+
+    send() forwards at most one event per *min_interval* seconds of wall
+    time; a newer event replaces the pending one and goes out with the next
+    send attempt once the interval has passed.  Only the latest event
+    matters for idempotent messages such as "progress" and
+    "convergence_update"; improvement and terminal events should bypass the
+    coalescer and use EVT_FIT_PROGRESS.send directly so they are never
+    dropped.
+    """
+    def __init__(self, min_interval=SEND_MIN_INTERVAL):
+        self.min_interval = min_interval
+        self._pending = None
+        self._last_send = 0.0
+
+    def send(self, evt):
+        self._pending = evt
+        if time.monotonic() - self._last_send >= self.min_interval:
+            self.flush()
+
+    def flush(self):
+        if self._pending is not None:
+            evt, self._pending = self._pending, None
+            self._last_send = time.monotonic()
+            EVT_FIT_PROGRESS.send(evt)
+
+
 class GUIProgressMonitor(monitor.TimedUpdate):
     def __init__(self, problem, progress=None, improvement=None):
         monitor.TimedUpdate.__init__(
             self, progress=progress or PROGRESS_DELAY,
             improvement=improvement or IMPROVEMENT_DELAY)
         self.problem = problem
+        self._coalesce = _EventCoalescer()
+        # The nllf scale depends only on the problem degrees of freedom,
+        # which are fixed for the life of the monitor, so compute it once
+        # rather than on every progress event.  Call invalidate() if the
+        # problem changes mid-fit.
+        self._scale, self._err = nllf_scale(problem)
+
+    def invalidate(self):
+        self._scale, self._err = nllf_scale(self.problem)
 
     def show_progress(self, history):
-        scale, err = nllf_scale(self.problem)
-        chisq = format_uncertainty(scale*history.value[0], err)
+        chisq = format_uncertainty(self._scale*history.value[0], self._err)
         evt = dict(
             # problem=self.problem,
             message="progress",
             step=history.step[0],
             value=history.value[0],
             chisq=chisq,
-            point=history.point[0]+0)  # avoid race
-        EVT_FIT_PROGRESS.send(evt)
+            point=history.point[0].copy())  # copy to avoid race with the fitter
+        self._coalesce.send(evt)
 
     def show_improvement(self, history):
         evt = dict(
             message="improvement",
             step=history.step[0],
             value=history.value[0],
-            point=history.point[0]+0)  # avoid race
+            point=history.point[0].copy())  # copy to avoid race with the fitter
         EVT_FIT_PROGRESS.send(evt)
 
 
@@ -71,12 +115,34 @@ class ConvergenceMonitor(monitor.Monitor):
     in the app to determine which progress panel should receive the event.
     """
 
-    def __init__(self, problem, message="convergence_update", rate=0):
+    def __init__(self, problem, message="convergence_update", rate=0,
+                 record_population=None):
         self.time = 0
         self.rate = rate  # rate=0 for no progress update, only final
         self.problem = problem
         self.message = message
-        self.pop = []
+        # With rate=0 the monitor never sends periodic updates, so by
+        # default don't pay for population order statistics on every step;
+        # pass record_population=True to gather them anyway for the final
+        # update.
+        self._record_population = (
+            record_population if record_population is not None else rate > 0)
+        # Convergence rows are stored in a preallocated array grown by
+        # doubling so that progress() is a cheap slice instead of rebuilding
+        # the full history from a list of tuples on every update.
+        self._pop = None
+        self._n = 0
+        self._coalesce = _EventCoalescer()
+
+    def _append(self, row):
+        if self._pop is None:
+            self._pop = np.empty((64, len(row)), 'd')
+        elif self._n == self._pop.shape[0]:
+            grown = np.empty((2*self._pop.shape[0],) + self._pop.shape[1:], 'd')
+            grown[:self._n] = self._pop
+            self._pop = grown
+        self._pop[self._n] = row
+        self._n += 1
 
 
     def config_history(self, history):
@@ -87,29 +153,40 @@ class ConvergenceMonitor(monitor.Monitor):
     def __call__(self, history):
         # from old ConvergenceMonitor:
         best = history.value[0]
-        try:
-            pop = history.population_values[0]
-            n = len(pop)
-            p = np.sort(pop)
-            QI,Qmid, = int(0.2*n),int(0.5*n)
-            self.pop.append((best, p[0],p[QI],p[Qmid],p[-1-QI],p[-1]))
-        except AttributeError:
-            self.pop.append((best, ))
+        if not self._record_population:
+            self._append((best, ))
+        else:
+            try:
+                pop = history.population_values[0]
+                n = len(pop)
+                QI,Qmid, = int(0.2*n),int(0.5*n)
+                # Only five order statistics are needed, so use a partial
+                # sort rather than sorting the entire population on every
+                # iteration.
+                p = np.partition(pop, (0, QI, Qmid, n-1-QI, n-1))
+                self._append((best, p[0],p[QI],p[Qmid],p[-1-QI],p[-1]))
+            except AttributeError:
+                self._append((best, ))
 
         if self.rate > 0 and history.time[0] >= self.time+self.rate:
             evt = dict(
                 message=self.message,
                 pop=self.progress())
-            EVT_FIT_PROGRESS.send(evt)
+            self._coalesce.send(evt)
             self.time = history.time[0]
 
     def progress(self):
-        return np.empty((0,1),'d') if not self.pop else np.array(self.pop)
+        # Readers only consume the rows, so a view over the filled portion
+        # of the buffer is safe to share.
+        return np.empty((0,1),'d') if self._n == 0 else self._pop[:self._n]
 
     def final(self):
         """
         Close out the monitor
         """
+        # The final event carries the full history, superseding anything
+        # still waiting in the coalescer, so send it directly.
+        self._coalesce._pending = None
         evt = dict(
             message=self.message,
             pop=self.progress())
@@ -130,6 +207,7 @@ class DreamMonitor(monitor.Monitor):
         self.fitter = fitter
         self.message = message
         self.uncertainty_state = None
+        self._coalesce = _EventCoalescer()
         # emit None uncertainty state to start with
         evt = dict(
             message=message,
@@ -147,12 +225,16 @@ class DreamMonitor(monitor.Monitor):
             update_counter = history.time[0] // self.rate
             if update_counter > self.update_counter:
                 self.update_counter = update_counter
+                # Send the live state object; the consumer snapshots it on
+                # the event loop side so the copy cost stays off the fit
+                # thread, and the coalescer collapses updates it can't keep
+                # up with.
                 evt = dict(
                     message=self.message,
                     time = self.time,
-                    uncertainty_state=deepcopy(self.uncertainty_state),
+                    uncertainty_state=self.uncertainty_state,
                 )
-                EVT_FIT_PROGRESS.send(evt)
+                self._coalesce.send(evt)
 
     def final(self):
         """
@@ -161,10 +243,14 @@ class DreamMonitor(monitor.Monitor):
         if self.uncertainty_state is not None:
             # Note: win.uncertainty_state protected by win.fit_lock
             # self.win.uncertainty_state = self.uncertainty_state
+            # The final state supersedes any pending periodic update.  The
+            # fit is over, so the consumer can snapshot (or keep) the live
+            # object without racing the sampler.
+            self._coalesce._pending = None
             evt = dict(
                 message="uncertainty_final",
                 time=self.time,
-                uncertainty_state=deepcopy(self.uncertainty_state),
+                uncertainty_state=self.uncertainty_state,
             )
             EVT_FIT_PROGRESS.send(evt)
 
@@ -177,7 +263,7 @@ class FitThread(Thread):
     def __init__(self, abort_event: Event, problem=None,
                  fitclass=None, options=None, mapper=None, parallel=0,
                  convergence_update=5, uncertainty_update=300,
-                 terminate_on_finish=False):
+                 monitor_period=1, terminate_on_finish=False):
         # base class initialization
         # Process.__init__(self)
 
@@ -190,6 +276,8 @@ class FitThread(Thread):
         self.parallel = parallel
         self.convergence_update = convergence_update
         self.uncertainty_update = uncertainty_update
+        # Call the monitors on only every Nth fit step; 1 means every step.
+        self.monitor_period = monitor_period
         self.terminate_on_finish = terminate_on_finish
 
     def abort_test(self):
@@ -217,6 +305,11 @@ class FitThread(Thread):
                                     message="uncertainty_update",
                                     rate=self.uncertainty_update),
                         ]
+            if self.monitor_period > 1:
+                # Sample the monitors so fast fitters don't spend their
+                # time on per-step observation; final() still runs in full.
+                monitors = [monitor.SampledMonitor(m, period=self.monitor_period)
+                            for m in monitors]
 
             mapper = self.mapper
             if mapper is None:
@@ -230,9 +323,20 @@ class FitThread(Thread):
                 # and multiprocessing is available, and parallel != 1
                 mapper = MPMapper if mp_available and self.parallel != 1 and can_pickle(self.problem) else SerialMapper
 
-            # Be safe and send a private copy of the problem to the fitting engine
+            # Be safe and send a private copy of the problem to the fitting
+            # engine.  Use the problem's own clone method when it has one,
+            # otherwise a pickle round trip, which is much faster than
+            # deepcopy for large model trees; deepcopy remains the fallback
+            # for problems that cannot be pickled.
             # print "fitclass",self.fitclass
-            problem = deepcopy(self.problem)
+            if hasattr(self.problem, 'clone'):
+                problem = self.problem.clone()
+            else:
+                try:
+                    problem = pickle.loads(pickle.dumps(
+                        self.problem, protocol=pickle.HIGHEST_PROTOCOL))
+                except Exception:
+                    problem = deepcopy(self.problem)
             # print "fitclass id",id(self.fitclass),self.fitclass,threading.current_thread()
             driver = FitDriver(
                 self.fitclass, problem=problem,